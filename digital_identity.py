@@ -3,12 +3,15 @@
 BlackRoad Digital Identity — Digital identity verification and KYC system
 """
 
+import os
 import sqlite3
 import hashlib
 import json
-import uuid
-from datetime import datetime, timedelta
-from dataclasses import dataclass, field, asdict
+import threading
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List
 from enum import Enum
 from pathlib import Path
@@ -16,6 +19,29 @@ from pathlib import Path
 
 DB_PATH = Path("digital_identity.db")
 
+_IDENTITY_TTL = timedelta(days=365*5)
+
+
+def _now_iso() -> str:
+    return datetime.utcnow().isoformat()
+
+
+def _new_id() -> str:
+    # 128 bits of os.urandom as hex: same entropy as uuid4 without the
+    # UUID-object construction and dash formatting overhead.
+    return os.urandom(16).hex()
+
+
+def _hash_biometric(biometric_data) -> str:
+    """Hash a biometric payload to the hex digest stored on the identity.
+
+    Accepts str or bytes; bytes are hashed as-is so large payloads skip the
+    intermediate encode copy.
+    """
+    if isinstance(biometric_data, str):
+        biometric_data = biometric_data.encode()
+    return hashlib.sha256(biometric_data).hexdigest()
+
 
 class VerificationLevel(str, Enum):
     UNVERIFIED = "unverified"
@@ -45,7 +71,39 @@ class IdentityStatus(str, Enum):
     SUSPENDED = "suspended"
 
 
-@dataclass
+# On-disk encoding: enum columns store the member's ordinal and timestamp
+# columns store microseconds since the Unix epoch. Integer keys compare
+# faster in the B-tree and pack more rows per page than ISO strings. The
+# Python API keeps the string forms; these tables translate at the SQL
+# boundary. Ordinals are positional, so new enum members must be appended.
+_LEVEL_TO_INT = {level.value: i for i, level in enumerate(VerificationLevel)}
+_INT_TO_LEVEL = [level.value for level in VerificationLevel]
+_STATUS_TO_INT = {st.value: i for i, st in enumerate(IdentityStatus)}
+_INT_TO_STATUS = [st.value for st in IdentityStatus]
+_KYC_TO_INT = {st.value: i for i, st in enumerate(KYCStatus)}
+_INT_TO_KYC = [st.value for st in KYCStatus]
+_DOCTYPE_TO_INT = {dt.value: i for i, dt in enumerate(DocType)}
+_INT_TO_DOCTYPE = [dt.value for dt in DocType]
+
+
+def _ts_to_int(iso: Optional[str]) -> Optional[int]:
+    """Encode a naive-UTC ISO timestamp as epoch microseconds."""
+    if iso is None:
+        return None
+    dt = datetime.fromisoformat(iso).replace(tzinfo=timezone.utc)
+    return int(dt.timestamp()) * 1_000_000 + dt.microsecond
+
+
+def _int_to_ts(value: Optional[int]) -> Optional[str]:
+    """Decode epoch microseconds back to the naive-UTC ISO form."""
+    if value is None:
+        return None
+    sec, usec = divmod(value, 1_000_000)
+    dt = datetime.fromtimestamp(sec, tz=timezone.utc).replace(tzinfo=None, microsecond=usec)
+    return dt.isoformat()
+
+
+@dataclass(slots=True)
 class Document:
     doc_type: DocType
     number: str
@@ -53,13 +111,21 @@ class Document:
     expiry: str
     verified: bool = False
     verified_at: Optional[str] = None
-    doc_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    doc_id: str = field(default_factory=_new_id)
 
     def to_dict(self):
-        return asdict(self)
-
-
-@dataclass
+        return {
+            "doc_type": self.doc_type,
+            "number": self.number,
+            "issuing_country": self.issuing_country,
+            "expiry": self.expiry,
+            "verified": self.verified,
+            "verified_at": self.verified_at,
+            "doc_id": self.doc_id,
+        }
+
+
+@dataclass(slots=True)
 class Identity:
     holder_name: str
     holder_email: str
@@ -67,16 +133,35 @@ class Identity:
     biometric_hash: Optional[str] = None
     verification_level: VerificationLevel = VerificationLevel.UNVERIFIED
     status: IdentityStatus = IdentityStatus.ACTIVE
-    issued_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    expires_at: str = field(default_factory=lambda: (datetime.utcnow() + timedelta(days=365*5)).isoformat())
-    identity_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    issued_at: Optional[str] = None
+    expires_at: Optional[str] = None
+    identity_id: str = field(default_factory=_new_id)
+
+    def __post_init__(self):
+        # One utcnow() covers both timestamps when neither is supplied.
+        if self.issued_at is None:
+            issued = datetime.utcnow()
+            self.issued_at = issued.isoformat()
+            if self.expires_at is None:
+                self.expires_at = (issued + _IDENTITY_TTL).isoformat()
+        elif self.expires_at is None:
+            self.expires_at = (datetime.fromisoformat(self.issued_at) + _IDENTITY_TTL).isoformat()
 
     def to_dict(self):
-        d = asdict(self)
-        return d
-
-
-@dataclass
+        return {
+            "holder_name": self.holder_name,
+            "holder_email": self.holder_email,
+            "documents": [d.to_dict() for d in self.documents],
+            "biometric_hash": self.biometric_hash,
+            "verification_level": self.verification_level,
+            "status": self.status,
+            "issued_at": self.issued_at,
+            "expires_at": self.expires_at,
+            "identity_id": self.identity_id,
+        }
+
+
+@dataclass(slots=True)
 class KYCRequest:
     identity_id: str
     requested_level: VerificationLevel
@@ -84,22 +169,85 @@ class KYCRequest:
     status: KYCStatus = KYCStatus.PENDING
     notes: str = ""
     processed_at: Optional[str] = None
-    request_id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    created_at: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    request_id: str = field(default_factory=_new_id)
+    created_at: str = field(default_factory=_now_iso)
 
     def to_dict(self):
-        return asdict(self)
+        return {
+            "identity_id": self.identity_id,
+            "requested_level": self.requested_level,
+            "documents_submitted": list(self.documents_submitted),
+            "status": self.status,
+            "notes": self.notes,
+            "processed_at": self.processed_at,
+            "request_id": self.request_id,
+            "created_at": self.created_at,
+        }
+
+
+# Shared SQL text for the hot statements. Keeping the text identical across
+# call sites lets sqlite3's per-connection statement cache skip re-preparing.
+_SQL_INSERT_AUDIT = "INSERT INTO audit_log VALUES (?,?,?,?,?)"
+_SQL_INSERT_IDENTITY = "INSERT INTO identities VALUES (?,?,?,?,?,?,?,?)"
+_SQL_INSERT_DOCUMENT = "INSERT INTO documents VALUES (?,?,?,?,?,?,?,?)"
+_SQL_INSERT_KYC = "INSERT INTO kyc_requests VALUES (?,?,?,?,?,?,?,?)"
+_SQL_IDENTITY_EXISTS = "SELECT identity_id FROM identities WHERE identity_id=?"
+_SQL_IDENTITY_STATUS = "SELECT status FROM identities WHERE identity_id=?"
+_SQL_SET_IDENTITY_STATUS = "UPDATE identities SET status=? WHERE identity_id=?"
+
+_local = threading.local()
+_schema_ready = False
+
+# Pool for read queries that can overlap under WAL; workers get their own
+# per-thread connections via get_connection.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="identity-read")
+
+
+def _db_file_key(path: str):
+    """Identify the database file by (device, inode), or None if absent."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
 
 
 def get_connection() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+    """Return this thread's cached connection, opening one if needed."""
+    global _schema_ready
+    path = str(DB_PATH)
+    key = _db_file_key(path)
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        if key is not None and getattr(_local, "key", None) == (path, key):
+            return conn
+        # DB_PATH was repointed or the file removed/recreated; drop the
+        # stale handle and make init_db run its schema script again. The
+        # inode check matters for pooled threads, whose cached handles
+        # would otherwise survive a delete-and-recreate of the same path.
+        conn.close()
+        _local.conn = None
+        _schema_ready = False
+    conn = sqlite3.connect(path, cached_statements=512)
     conn.row_factory = sqlite3.Row
+    # journal_mode is persistent; the rest are per-connection and must be
+    # reapplied on every new handle.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-20000")
+    _local.conn = conn
+    _local.key = (path, _db_file_key(path))
     return conn
 
 
 def init_db():
-    """Initialize database schema."""
+    """Initialize database schema (no-op after the first successful run)."""
+    global _schema_ready
     conn = get_connection()
+    if _schema_ready:
+        return
     cur = conn.cursor()
     cur.executescript("""
         CREATE TABLE IF NOT EXISTS identities (
@@ -107,33 +255,33 @@ def init_db():
             holder_name     TEXT NOT NULL,
             holder_email    TEXT UNIQUE NOT NULL,
             biometric_hash  TEXT,
-            verification_level TEXT DEFAULT 'unverified',
-            status          TEXT DEFAULT 'active',
-            issued_at       TEXT NOT NULL,
-            expires_at      TEXT NOT NULL
+            verification_level INTEGER DEFAULT 0,
+            status          INTEGER DEFAULT 0,
+            issued_at       INTEGER NOT NULL,
+            expires_at      INTEGER NOT NULL
         );
 
         CREATE TABLE IF NOT EXISTS documents (
             doc_id          TEXT PRIMARY KEY,
             identity_id     TEXT NOT NULL,
-            doc_type        TEXT NOT NULL,
+            doc_type        INTEGER NOT NULL,
             number          TEXT NOT NULL,
             issuing_country TEXT NOT NULL,
             expiry          TEXT NOT NULL,
             verified        INTEGER DEFAULT 0,
-            verified_at     TEXT,
+            verified_at     INTEGER,
             FOREIGN KEY (identity_id) REFERENCES identities(identity_id)
         );
 
         CREATE TABLE IF NOT EXISTS kyc_requests (
             request_id      TEXT PRIMARY KEY,
             identity_id     TEXT NOT NULL,
-            requested_level TEXT NOT NULL,
+            requested_level INTEGER NOT NULL,
             documents_submitted TEXT DEFAULT '[]',
-            status          TEXT DEFAULT 'pending',
+            status          INTEGER DEFAULT 0,
             notes           TEXT DEFAULT '',
-            processed_at    TEXT,
-            created_at      TEXT NOT NULL,
+            processed_at    INTEGER,
+            created_at      INTEGER NOT NULL,
             FOREIGN KEY (identity_id) REFERENCES identities(identity_id)
         );
 
@@ -142,88 +290,197 @@ def init_db():
             identity_id TEXT,
             action      TEXT NOT NULL,
             details     TEXT,
-            timestamp   TEXT NOT NULL
+            timestamp   INTEGER NOT NULL
         );
+
+        CREATE INDEX IF NOT EXISTS ix_docs_ident ON documents(identity_id);
+        CREATE INDEX IF NOT EXISTS ix_kyc_ident_created ON kyc_requests(identity_id, created_at DESC);
+        CREATE INDEX IF NOT EXISTS ix_audit_ident_ts ON audit_log(identity_id, timestamp);
+        CREATE INDEX IF NOT EXISTS ix_ident_status ON identities(status);
+        CREATE INDEX IF NOT EXISTS ix_ident_level ON identities(verification_level);
+        CREATE INDEX IF NOT EXISTS ix_ident_expires ON identities(expires_at) WHERE status=0;
+
+        CREATE VIRTUAL TABLE IF NOT EXISTS identities_fts USING fts5(
+            holder_name, holder_email,
+            content='identities', content_rowid='rowid'
+        );
+
+        CREATE TRIGGER IF NOT EXISTS trg_ident_fts_ai AFTER INSERT ON identities BEGIN
+            INSERT INTO identities_fts(rowid, holder_name, holder_email)
+            VALUES (new.rowid, new.holder_name, new.holder_email);
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_ident_fts_ad AFTER DELETE ON identities BEGIN
+            INSERT INTO identities_fts(identities_fts, rowid, holder_name, holder_email)
+            VALUES ('delete', old.rowid, old.holder_name, old.holder_email);
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_ident_fts_au AFTER UPDATE ON identities BEGIN
+            INSERT INTO identities_fts(identities_fts, rowid, holder_name, holder_email)
+            VALUES ('delete', old.rowid, old.holder_name, old.holder_email);
+            INSERT INTO identities_fts(rowid, holder_name, holder_email)
+            VALUES (new.rowid, new.holder_name, new.holder_email);
+        END;
     """)
     conn.commit()
-    conn.close()
+    _schema_ready = True
 
 
-def _log_action(identity_id: str, action: str, details: str = ""):
+def _invalidate_read_cache():
+    """Drop memoized read results after any write.
+
+    Keeps the lru_cache-wrapped lookups below coherent with the database;
+    every mutating function calls this once its transaction has committed.
+    """
+    check_verification_level.cache_clear()
+    get_audit_trail.cache_clear()
+    get_documents.cache_clear()
+    get_kyc_history.cache_clear()
+
+
+def _log_action(identity_id: str, action: str, details: str = "",
+                conn: Optional[sqlite3.Connection] = None,
+                now: Optional[str] = None):
+    """Append an audit row, joining the caller's transaction if one is given.
+
+    Callers that already hold a timestamp pass it as ``now`` to avoid a
+    second ``utcnow()`` per operation.
+    """
+    row = (_new_id(), identity_id, action, details, _ts_to_int(now or _now_iso()))
+    if conn is not None:
+        conn.execute(_SQL_INSERT_AUDIT, row)
+        return
     conn = get_connection()
-    conn.execute(
-        "INSERT INTO audit_log VALUES (?,?,?,?,?)",
-        (str(uuid.uuid4()), identity_id, action, details, datetime.utcnow().isoformat())
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(_SQL_INSERT_AUDIT, row)
 
 
 def create_identity(name: str, email: str, biometric_data: Optional[str] = None) -> Identity:
     """Create a new digital identity."""
-    init_db()
-    biometric_hash = hashlib.sha256(biometric_data.encode()).hexdigest() if biometric_data else None
+    biometric_hash = _hash_biometric(biometric_data) if biometric_data else None
     identity = Identity(holder_name=name, holder_email=email, biometric_hash=biometric_hash)
     conn = get_connection()
-    conn.execute(
-        "INSERT INTO identities VALUES (?,?,?,?,?,?,?,?)",
-        (identity.identity_id, name, email, biometric_hash,
-         identity.verification_level.value, identity.status.value,
-         identity.issued_at, identity.expires_at)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity.identity_id, "CREATE_IDENTITY", f"Created identity for {email}")
+    with conn:
+        conn.execute(
+            _SQL_INSERT_IDENTITY,
+            (identity.identity_id, name, email, biometric_hash,
+             _LEVEL_TO_INT[identity.verification_level.value],
+             _STATUS_TO_INT[identity.status.value],
+             _ts_to_int(identity.issued_at), _ts_to_int(identity.expires_at))
+        )
+        _log_action(identity.identity_id, "CREATE_IDENTITY", f"Created identity for {email}",
+                    conn=conn, now=identity.issued_at)
+    _invalidate_read_cache()
     return identity
 
 
+def create_identities(records: List[tuple]) -> List[Identity]:
+    """Create many identities in a single transaction.
+
+    ``records`` is a list of ``(name, email)`` or ``(name, email,
+    biometric_data)`` tuples.
+    """
+    identities = []
+    for record in records:
+        name, email = record[0], record[1]
+        biometric_data = record[2] if len(record) > 2 else None
+        biometric_hash = _hash_biometric(biometric_data) if biometric_data else None
+        identities.append(Identity(holder_name=name, holder_email=email, biometric_hash=biometric_hash))
+    now = _now_iso()
+    conn = get_connection()
+    with conn:
+        conn.executemany(
+            _SQL_INSERT_IDENTITY,
+            [(i.identity_id, i.holder_name, i.holder_email, i.biometric_hash,
+              _LEVEL_TO_INT[i.verification_level.value], _STATUS_TO_INT[i.status.value],
+              _ts_to_int(i.issued_at), _ts_to_int(i.expires_at))
+             for i in identities]
+        )
+        conn.executemany(
+            _SQL_INSERT_AUDIT,
+            [(_new_id(), i.identity_id, "CREATE_IDENTITY",
+              f"Created identity for {i.holder_email}", _ts_to_int(now))
+             for i in identities]
+        )
+    _invalidate_read_cache()
+    return identities
+
+
 def submit_document(identity_id: str, doc_type: DocType, number: str,
                     country: str, expiry: str) -> Document:
     """Submit a document for an identity."""
     doc = Document(doc_type=doc_type, number=number, issuing_country=country, expiry=expiry)
     conn = get_connection()
-    row = conn.execute("SELECT identity_id FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(_SQL_IDENTITY_EXISTS, (identity_id,)).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
-    conn.execute(
-        "INSERT INTO documents VALUES (?,?,?,?,?,?,?,?)",
-        (doc.doc_id, identity_id, doc_type.value if isinstance(doc_type, DocType) else doc_type,
-         number, country, expiry, 0, None)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "SUBMIT_DOCUMENT", f"Submitted {doc_type} document")
+    with conn:
+        conn.execute(
+            _SQL_INSERT_DOCUMENT,
+            (doc.doc_id, identity_id,
+             _DOCTYPE_TO_INT[doc_type.value if isinstance(doc_type, DocType) else doc_type],
+             number, country, expiry, 0, None)
+        )
+        _log_action(identity_id, "SUBMIT_DOCUMENT", f"Submitted {doc_type} document", conn=conn)
+    _invalidate_read_cache()
     return doc
 
 
+def submit_documents(identity_id: str, docs: List[tuple]) -> List[Document]:
+    """Submit many documents for an identity in a single transaction.
+
+    ``docs`` is a list of ``(doc_type, number, country, expiry)`` tuples.
+    """
+    conn = get_connection()
+    row = conn.execute(_SQL_IDENTITY_EXISTS, (identity_id,)).fetchone()
+    if not row:
+        raise ValueError(f"Identity {identity_id} not found")
+    documents = [
+        Document(doc_type=doc_type, number=number, issuing_country=country, expiry=expiry)
+        for doc_type, number, country, expiry in docs
+    ]
+    now = _now_iso()
+    with conn:
+        conn.executemany(
+            _SQL_INSERT_DOCUMENT,
+            [(d.doc_id, identity_id,
+              _DOCTYPE_TO_INT[d.doc_type.value if isinstance(d.doc_type, DocType) else d.doc_type],
+              d.number, d.issuing_country, d.expiry, 0, None)
+             for d in documents]
+        )
+        conn.executemany(
+            _SQL_INSERT_AUDIT,
+            [(_new_id(), identity_id, "SUBMIT_DOCUMENT",
+              f"Submitted {d.doc_type} document", _ts_to_int(now))
+             for d in documents]
+        )
+    _invalidate_read_cache()
+    return documents
+
+
 def verify_document(identity_id: str, doc_id: str) -> bool:
     """Verify a submitted document."""
     conn = get_connection()
     row = conn.execute(
-        "SELECT * FROM documents WHERE doc_id=? AND identity_id=?",
+        "SELECT 1 FROM documents WHERE doc_id=? AND identity_id=? LIMIT 1",
         (doc_id, identity_id)
     ).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Document {doc_id} not found for identity {identity_id}")
-    now = datetime.utcnow().isoformat()
-    conn.execute(
-        "UPDATE documents SET verified=1, verified_at=? WHERE doc_id=?",
-        (now, doc_id)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "VERIFY_DOCUMENT", f"Document {doc_id} verified")
+    now = _now_iso()
+    with conn:
+        conn.execute(
+            "UPDATE documents SET verified=1, verified_at=? WHERE doc_id=?",
+            (_ts_to_int(now), doc_id)
+        )
+        _log_action(identity_id, "VERIFY_DOCUMENT", f"Document {doc_id} verified", conn=conn, now=now)
+    _invalidate_read_cache()
     return True
 
 
 def initiate_kyc(identity_id: str, requested_level: VerificationLevel) -> KYCRequest:
     """Initiate a KYC request for an identity."""
     conn = get_connection()
-    row = conn.execute("SELECT * FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(_SQL_IDENTITY_EXISTS, (identity_id,)).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
     docs = conn.execute(
         "SELECT doc_id FROM documents WHERE identity_id=? AND verified=1",
@@ -235,140 +492,184 @@ def initiate_kyc(identity_id: str, requested_level: VerificationLevel) -> KYCReq
         requested_level=requested_level,
         documents_submitted=doc_ids
     )
-    conn.execute(
-        "INSERT INTO kyc_requests VALUES (?,?,?,?,?,?,?,?)",
-        (req.request_id, identity_id, requested_level.value if isinstance(requested_level, VerificationLevel) else requested_level,
-         json.dumps(doc_ids), req.status.value, req.notes, req.processed_at, req.created_at)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "INITIATE_KYC", f"KYC requested for level {requested_level}")
+    with conn:
+        conn.execute(
+            _SQL_INSERT_KYC,
+            (req.request_id, identity_id,
+             _LEVEL_TO_INT[requested_level.value if isinstance(requested_level, VerificationLevel) else requested_level],
+             json.dumps(doc_ids), _KYC_TO_INT[req.status.value], req.notes,
+             _ts_to_int(req.processed_at), _ts_to_int(req.created_at))
+        )
+        _log_action(identity_id, "INITIATE_KYC", f"KYC requested for level {requested_level}",
+                    conn=conn, now=req.created_at)
+    _invalidate_read_cache()
     return req
 
 
 def process_kyc(request_id: str) -> KYCRequest:
     """Process a pending KYC request."""
     conn = get_connection()
-    row = conn.execute("SELECT * FROM kyc_requests WHERE request_id=?", (request_id,)).fetchone()
+    row = conn.execute(
+        "SELECT status, requested_level, identity_id, documents_submitted"
+        " FROM kyc_requests WHERE request_id=?",
+        (request_id,)
+    ).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"KYC request {request_id} not found")
-    if row["status"] != KYCStatus.PENDING.value:
-        conn.close()
+    if row["status"] != _KYC_TO_INT[KYCStatus.PENDING.value]:
         raise ValueError(f"KYC request {request_id} is not in pending state")
-    now = datetime.utcnow().isoformat()
-    conn.execute(
-        "UPDATE kyc_requests SET status=?, processed_at=? WHERE request_id=?",
-        (KYCStatus.PROCESSING.value, now, request_id)
-    )
-    conn.commit()
-
-    doc_ids = json.loads(row["documents_submitted"])
-    docs = conn.execute(
-        f"SELECT * FROM documents WHERE doc_id IN ({','.join('?'*len(doc_ids))})",
-        doc_ids
-    ).fetchall() if doc_ids else []
-
-    all_verified = len(docs) > 0 and all(d["verified"] for d in docs)
-    requested_level = row["requested_level"]
-    meets_doc_requirements = _check_doc_requirements(requested_level, docs)
-
-    if all_verified and meets_doc_requirements:
-        new_status = KYCStatus.APPROVED.value
-        notes = "All documents verified and requirements met."
+    now = _now_iso()
+    with conn:
         conn.execute(
-            "UPDATE identities SET verification_level=? WHERE identity_id=?",
-            (requested_level, row["identity_id"])
+            "UPDATE kyc_requests SET status=?, processed_at=? WHERE request_id=?",
+            (_KYC_TO_INT[KYCStatus.PROCESSING.value], _ts_to_int(now), request_id)
         )
-    else:
-        new_status = KYCStatus.REJECTED.value
-        notes = "Insufficient verified documents or requirements not met."
 
-    conn.execute(
-        "UPDATE kyc_requests SET status=?, notes=?, processed_at=? WHERE request_id=?",
-        (new_status, notes, now, request_id)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(row["identity_id"], "PROCESS_KYC", f"KYC {request_id}: {new_status}")
+    doc_ids = json.loads(row["documents_submitted"])
+    if doc_ids:
+        agg = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(verified), 0), GROUP_CONCAT(DISTINCT doc_type)"
+            " FROM documents WHERE doc_id IN (SELECT value FROM json_each(?))",
+            (row["documents_submitted"],)
+        ).fetchone()
+        doc_count, verified_count = agg[0], agg[1]
+        doc_types = {_INT_TO_DOCTYPE[int(t)] for t in agg[2].split(",")} if agg[2] else set()
+    else:
+        doc_count = verified_count = 0
+        doc_types = set()
+
+    all_verified = doc_count > 0 and verified_count == doc_count
+    requested_level = _INT_TO_LEVEL[row["requested_level"]]
+    meets_doc_requirements = _check_doc_requirements(requested_level, doc_count, doc_types)
+
+    with conn:
+        if all_verified and meets_doc_requirements:
+            new_status = KYCStatus.APPROVED.value
+            notes = "All documents verified and requirements met."
+            conn.execute(
+                "UPDATE identities SET verification_level=? WHERE identity_id=?",
+                (_LEVEL_TO_INT[requested_level], row["identity_id"])
+            )
+        else:
+            new_status = KYCStatus.REJECTED.value
+            notes = "Insufficient verified documents or requirements not met."
+
+        updated = conn.execute(
+            "UPDATE kyc_requests SET status=?, notes=?, processed_at=? WHERE request_id=?"
+            " RETURNING *",
+            (_KYC_TO_INT[new_status], notes, _ts_to_int(now), request_id)
+        ).fetchone()
+        _log_action(row["identity_id"], "PROCESS_KYC", f"KYC {request_id}: {new_status}", conn=conn, now=now)
+    _invalidate_read_cache()
 
     req = KYCRequest(
-        identity_id=row["identity_id"],
-        requested_level=VerificationLevel(requested_level),
+        identity_id=updated["identity_id"],
+        requested_level=VerificationLevel(_INT_TO_LEVEL[updated["requested_level"]]),
         documents_submitted=doc_ids,
-        status=KYCStatus(new_status),
-        notes=notes,
-        processed_at=now,
+        status=KYCStatus(_INT_TO_KYC[updated["status"]]),
+        notes=updated["notes"],
+        processed_at=_int_to_ts(updated["processed_at"]),
         request_id=request_id,
-        created_at=row["created_at"]
+        created_at=_int_to_ts(updated["created_at"])
     )
     return req
 
 
-def _check_doc_requirements(level: str, docs: list) -> bool:
+def _check_doc_requirements(level: str, doc_count: int, doc_types: set) -> bool:
     """Check if documents meet the level requirements."""
-    doc_types = {d["doc_type"] for d in docs}
     if level == VerificationLevel.BASIC.value:
-        return len(docs) >= 1
+        return doc_count >= 1
     elif level == VerificationLevel.STANDARD.value:
-        return len(docs) >= 2
+        return doc_count >= 2
     elif level == VerificationLevel.ENHANCED.value:
         primary = {DocType.PASSPORT.value, DocType.NATIONAL_ID.value}
-        return len(docs) >= 3 and bool(primary & doc_types)
+        return doc_count >= 3 and bool(primary & doc_types)
     return True
 
 
+def _decode_identity_row(row: sqlite3.Row) -> dict:
+    # Build the dict in one pass rather than dict(row) plus per-key
+    # overwrites, which would copy every cell twice.
+    return {
+        "identity_id": row["identity_id"],
+        "holder_name": row["holder_name"],
+        "holder_email": row["holder_email"],
+        "biometric_hash": row["biometric_hash"],
+        "verification_level": _INT_TO_LEVEL[row["verification_level"]],
+        "status": _INT_TO_STATUS[row["status"]],
+        "issued_at": _int_to_ts(row["issued_at"]),
+        "expires_at": _int_to_ts(row["expires_at"]),
+    }
+
+
+def _decode_document_row(row: sqlite3.Row) -> dict:
+    return {
+        "doc_id": row["doc_id"],
+        "identity_id": row["identity_id"],
+        "doc_type": _INT_TO_DOCTYPE[row["doc_type"]],
+        "number": row["number"],
+        "issuing_country": row["issuing_country"],
+        "expiry": row["expiry"],
+        "verified": row["verified"],
+        "verified_at": _int_to_ts(row["verified_at"]),
+    }
+
+
+@lru_cache(maxsize=1024)
 def check_verification_level(identity_id: str) -> dict:
     """Check the current verification level and status of an identity."""
     conn = get_connection()
-    row = conn.execute("SELECT * FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(
+        """
+        SELECT i.holder_name, i.holder_email, i.verification_level, i.status,
+               i.issued_at, i.expires_at,
+               (SELECT COUNT(*) FROM documents d WHERE d.identity_id=i.identity_id) AS total_docs,
+               (SELECT COUNT(*) FROM documents d WHERE d.identity_id=i.identity_id AND d.verified=1) AS verified_docs,
+               (SELECT COUNT(*) FROM kyc_requests k WHERE k.identity_id=i.identity_id
+                       AND k.status IN (?,?)) AS pending_kyc,
+               (SELECT status FROM kyc_requests k WHERE k.identity_id=i.identity_id
+                       ORDER BY created_at DESC LIMIT 1) AS last_kyc_status
+        FROM identities i WHERE i.identity_id=?
+        """,
+        (_KYC_TO_INT[KYCStatus.PENDING.value], _KYC_TO_INT[KYCStatus.PROCESSING.value],
+         identity_id)
+    ).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
-    docs = conn.execute(
-        "SELECT * FROM documents WHERE identity_id=?", (identity_id,)
-    ).fetchall()
-    kyc_requests = conn.execute(
-        "SELECT * FROM kyc_requests WHERE identity_id=? ORDER BY created_at DESC",
-        (identity_id,)
-    ).fetchall()
-    conn.close()
-
-    verified_docs = [d for d in docs if d["verified"]]
-    pending_kyc = [k for k in kyc_requests if k["status"] in (KYCStatus.PENDING.value, KYCStatus.PROCESSING.value)]
 
     return {
         "identity_id": identity_id,
         "holder_name": row["holder_name"],
         "holder_email": row["holder_email"],
-        "verification_level": row["verification_level"],
-        "status": row["status"],
-        "issued_at": row["issued_at"],
-        "expires_at": row["expires_at"],
-        "total_documents": len(docs),
-        "verified_documents": len(verified_docs),
-        "pending_kyc_requests": len(pending_kyc),
-        "last_kyc_status": kyc_requests[0]["status"] if kyc_requests else None,
+        "verification_level": _INT_TO_LEVEL[row["verification_level"]],
+        "status": _INT_TO_STATUS[row["status"]],
+        "issued_at": _int_to_ts(row["issued_at"]),
+        "expires_at": _int_to_ts(row["expires_at"]),
+        "total_documents": row["total_docs"],
+        "verified_documents": row["verified_docs"],
+        "pending_kyc_requests": row["pending_kyc"],
+        "last_kyc_status": (_INT_TO_KYC[row["last_kyc_status"]]
+                            if row["last_kyc_status"] is not None else None),
     }
 
 
 def revoke_identity(identity_id: str, reason: str) -> bool:
     """Revoke a digital identity."""
     conn = get_connection()
-    row = conn.execute("SELECT * FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(_SQL_IDENTITY_EXISTS, (identity_id,)).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
-    conn.execute(
-        "UPDATE identities SET status=? WHERE identity_id=?",
-        (IdentityStatus.REVOKED.value, identity_id)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "REVOKE_IDENTITY", f"Reason: {reason}")
+    with conn:
+        conn.execute(
+            _SQL_SET_IDENTITY_STATUS,
+            (_STATUS_TO_INT[IdentityStatus.REVOKED.value], identity_id)
+        )
+        _log_action(identity_id, "REVOKE_IDENTITY", f"Reason: {reason}", conn=conn)
+    _invalidate_read_cache()
     return True
 
 
+@lru_cache(maxsize=1024)
 def get_audit_trail(identity_id: str) -> List[dict]:
     """Get the full audit trail for an identity."""
     conn = get_connection()
@@ -376,8 +677,16 @@ def get_audit_trail(identity_id: str) -> List[dict]:
         "SELECT * FROM audit_log WHERE identity_id=? ORDER BY timestamp ASC",
         (identity_id,)
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return [
+        {
+            "log_id": r["log_id"],
+            "identity_id": r["identity_id"],
+            "action": r["action"],
+            "details": r["details"],
+            "timestamp": _int_to_ts(r["timestamp"]),
+        }
+        for r in rows
+    ]
 
 
 def list_identities(status: Optional[str] = None, level: Optional[str] = None) -> List[dict]:
@@ -387,39 +696,35 @@ def list_identities(status: Optional[str] = None, level: Optional[str] = None) -
     params = []
     if status:
         query += " AND status=?"
-        params.append(status)
+        params.append(_STATUS_TO_INT[status])
     if level:
         query += " AND verification_level=?"
-        params.append(level)
+        params.append(_LEVEL_TO_INT[level])
     rows = conn.execute(query, params).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return [_decode_identity_row(r) for r in rows]
 
 
 def identity_stats() -> dict:
     """Get aggregate statistics about all identities."""
     conn = get_connection()
-    total = conn.execute("SELECT COUNT(*) FROM identities").fetchone()[0]
-    by_level = {}
-    for level in VerificationLevel:
-        cnt = conn.execute(
-            "SELECT COUNT(*) FROM identities WHERE verification_level=?",
-            (level.value,)
-        ).fetchone()[0]
-        by_level[level.value] = cnt
-    by_status = {}
-    for st in IdentityStatus:
-        cnt = conn.execute(
-            "SELECT COUNT(*) FROM identities WHERE status=?",
-            (st.value,)
-        ).fetchone()[0]
-        by_status[st.value] = cnt
+    by_level = {level.value: 0 for level in VerificationLevel}
+    by_status = {st.value: 0 for st in IdentityStatus}
+    total = 0
+    for level, status, cnt in conn.execute(
+        "SELECT verification_level, status, COUNT(*) FROM identities"
+        " GROUP BY verification_level, status"
+    ):
+        by_level[_INT_TO_LEVEL[level]] += cnt
+        by_status[_INT_TO_STATUS[status]] += cnt
+        total += cnt
+    doc_row = conn.execute(
+        "SELECT COUNT(*), COALESCE(SUM(verified), 0) FROM documents"
+    ).fetchone()
+    total_docs, verified_docs = doc_row[0], doc_row[1]
     pending_kyc = conn.execute(
-        "SELECT COUNT(*) FROM kyc_requests WHERE status IN ('pending','processing')"
+        "SELECT COUNT(*) FROM kyc_requests WHERE status IN (?,?)",
+        (_KYC_TO_INT[KYCStatus.PENDING.value], _KYC_TO_INT[KYCStatus.PROCESSING.value])
     ).fetchone()[0]
-    total_docs = conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
-    verified_docs = conn.execute("SELECT COUNT(*) FROM documents WHERE verified=1").fetchone()[0]
-    conn.close()
     return {
         "total_identities": total,
         "by_verification_level": by_level,
@@ -432,40 +737,52 @@ def identity_stats() -> dict:
 
 
 def expire_old_identities() -> int:
-    """Mark expired identities as expired."""
-    now = datetime.utcnow().isoformat()
+    """Mark expired identities as expired, auditing each one."""
+    now = _now_iso()
     conn = get_connection()
-    cur = conn.execute(
-        "UPDATE identities SET status=? WHERE expires_at < ? AND status=?",
-        (IdentityStatus.EXPIRED.value, now, IdentityStatus.ACTIVE.value)
-    )
-    count = cur.rowcount
-    conn.commit()
-    conn.close()
-    return count
+    with conn:
+        expired = conn.execute(
+            "UPDATE identities SET status=? WHERE expires_at < ? AND status=?"
+            " RETURNING identity_id",
+            (_STATUS_TO_INT[IdentityStatus.EXPIRED.value], _ts_to_int(now),
+             _STATUS_TO_INT[IdentityStatus.ACTIVE.value])
+        ).fetchall()
+        conn.executemany(
+            _SQL_INSERT_AUDIT,
+            [(_new_id(), r["identity_id"], "EXPIRE_IDENTITY", "Identity expired", _ts_to_int(now))
+             for r in expired]
+        )
+    _invalidate_read_cache()
+    return len(expired)
 
 
 def search_identity(query: str) -> List[dict]:
     """Search identities by name or email."""
+    # Quote each token and append * so the FTS index serves prefix matches;
+    # quoting keeps characters like @ and . from being parsed as syntax.
+    tokens = ['"{}"*'.format(t.replace('"', '""')) for t in query.split()]
+    if not tokens:
+        return list_identities()
     conn = get_connection()
     rows = conn.execute(
-        "SELECT * FROM identities WHERE holder_name LIKE ? OR holder_email LIKE ?",
-        (f"%{query}%", f"%{query}%")
+        "SELECT i.* FROM identities i JOIN identities_fts f ON f.rowid=i.rowid"
+        " WHERE identities_fts MATCH ?",
+        (" ".join(tokens),)
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return [_decode_identity_row(r) for r in rows]
 
 
+@lru_cache(maxsize=1024)
 def get_documents(identity_id: str) -> List[dict]:
     """Get all documents for an identity."""
     conn = get_connection()
     rows = conn.execute(
         "SELECT * FROM documents WHERE identity_id=?", (identity_id,)
     ).fetchall()
-    conn.close()
-    return [dict(r) for r in rows]
+    return [_decode_document_row(r) for r in rows]
 
 
+@lru_cache(maxsize=1024)
 def get_kyc_history(identity_id: str) -> List[dict]:
     """Get KYC request history for an identity."""
     conn = get_connection()
@@ -473,58 +790,67 @@ def get_kyc_history(identity_id: str) -> List[dict]:
         "SELECT * FROM kyc_requests WHERE identity_id=? ORDER BY created_at DESC",
         (identity_id,)
     ).fetchall()
-    conn.close()
-    result = []
-    for r in rows:
-        d = dict(r)
-        d["documents_submitted"] = json.loads(d["documents_submitted"])
-        result.append(d)
-    return result
+    return [
+        {
+            "request_id": r["request_id"],
+            "identity_id": r["identity_id"],
+            "requested_level": _INT_TO_LEVEL[r["requested_level"]],
+            "documents_submitted": json.loads(r["documents_submitted"]),
+            "status": _INT_TO_KYC[r["status"]],
+            "notes": r["notes"],
+            "processed_at": _int_to_ts(r["processed_at"]),
+            "created_at": _int_to_ts(r["created_at"]),
+        }
+        for r in rows
+    ]
 
 
 def suspend_identity(identity_id: str, reason: str) -> bool:
     """Temporarily suspend an identity."""
     conn = get_connection()
-    row = conn.execute("SELECT status FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(_SQL_IDENTITY_STATUS, (identity_id,)).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
-    conn.execute(
-        "UPDATE identities SET status=? WHERE identity_id=?",
-        (IdentityStatus.SUSPENDED.value, identity_id)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "SUSPEND_IDENTITY", f"Reason: {reason}")
+    with conn:
+        conn.execute(
+            _SQL_SET_IDENTITY_STATUS,
+            (_STATUS_TO_INT[IdentityStatus.SUSPENDED.value], identity_id)
+        )
+        _log_action(identity_id, "SUSPEND_IDENTITY", f"Reason: {reason}", conn=conn)
+    _invalidate_read_cache()
     return True
 
 
 def reactivate_identity(identity_id: str) -> bool:
     """Reactivate a suspended identity."""
     conn = get_connection()
-    row = conn.execute("SELECT status FROM identities WHERE identity_id=?", (identity_id,)).fetchone()
+    row = conn.execute(_SQL_IDENTITY_STATUS, (identity_id,)).fetchone()
     if not row:
-        conn.close()
         raise ValueError(f"Identity {identity_id} not found")
-    if row["status"] != IdentityStatus.SUSPENDED.value:
-        conn.close()
+    if row["status"] != _STATUS_TO_INT[IdentityStatus.SUSPENDED.value]:
         raise ValueError(f"Identity {identity_id} is not suspended")
-    conn.execute(
-        "UPDATE identities SET status=? WHERE identity_id=?",
-        (IdentityStatus.ACTIVE.value, identity_id)
-    )
-    conn.commit()
-    conn.close()
-    _log_action(identity_id, "REACTIVATE_IDENTITY", "Identity reactivated")
+    with conn:
+        conn.execute(
+            _SQL_SET_IDENTITY_STATUS,
+            (_STATUS_TO_INT[IdentityStatus.ACTIVE.value], identity_id)
+        )
+        _log_action(identity_id, "REACTIVATE_IDENTITY", "Identity reactivated", conn=conn)
+    _invalidate_read_cache()
     return True
 
 
 def generate_identity_report(identity_id: str) -> str:
     """Generate a human-readable identity report."""
-    info = check_verification_level(identity_id)
-    docs = get_documents(identity_id)
-    kyc = get_kyc_history(identity_id)
-    audit = get_audit_trail(identity_id)
+    # The four reads are independent and WAL allows concurrent readers, so
+    # issue them in parallel on the pool.
+    info_f = _EXECUTOR.submit(check_verification_level, identity_id)
+    docs_f = _EXECUTOR.submit(get_documents, identity_id)
+    kyc_f = _EXECUTOR.submit(get_kyc_history, identity_id)
+    audit_f = _EXECUTOR.submit(get_audit_trail, identity_id)
+    info = info_f.result()
+    docs = docs_f.result()
+    kyc = kyc_f.result()
+    audit = audit_f.result()
 
     lines = [
         "=" * 60,
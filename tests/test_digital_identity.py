@@ -30,6 +30,16 @@ def test_create_identity():
     assert identity.status == di.IdentityStatus.ACTIVE
 
 
+def test_create_identities_bulk():
+    identities = di.create_identities([
+        ("Alice Smith", "alice@example.com"),
+        ("Bob Jones", "bob@example.com", "fingerprint-data"),
+    ])
+    assert len(identities) == 2
+    assert identities[1].biometric_hash is not None
+    assert len(di.list_identities()) == 2
+
+
 def test_submit_document():
     identity = di.create_identity("Bob Jones", "bob@example.com")
     doc = di.submit_document(
@@ -43,6 +53,16 @@ def test_submit_document():
     assert doc.verified is False
 
 
+def test_submit_documents_bulk():
+    identity = di.create_identity("Bob Jones", "bob@example.com")
+    docs = di.submit_documents(identity.identity_id, [
+        (di.DocType.PASSPORT, "P123456", "US", "2030-01-01"),
+        (di.DocType.UTILITY_BILL, "UB-42", "US", "2027-01-01"),
+    ])
+    assert len(docs) == 2
+    assert len(di.get_documents(identity.identity_id)) == 2
+
+
 def test_verify_document():
     identity = di.create_identity("Carol White", "carol@example.com")
     doc = di.submit_document(identity.identity_id, di.DocType.LICENSE, "DL789", "CA", "2028-06-01")
@@ -105,6 +125,22 @@ def test_audit_trail():
     assert "SUBMIT_DOCUMENT" in actions
 
 
+def test_expire_old_identities():
+    identity = di.create_identity("Old Timer", "old@example.com")
+    conn = di.get_connection()
+    with conn:
+        conn.execute(
+            "UPDATE identities SET expires_at=? WHERE identity_id=?",
+            (di._ts_to_int("2000-01-01T00:00:00"), identity.identity_id)
+        )
+    count = di.expire_old_identities()
+    assert count == 1
+    info = di.check_verification_level(identity.identity_id)
+    assert info["status"] == di.IdentityStatus.EXPIRED.value
+    actions = [a["action"] for a in di.get_audit_trail(identity.identity_id)]
+    assert "EXPIRE_IDENTITY" in actions
+
+
 def test_generate_report():
     identity = di.create_identity("Karl Marx", "karl@example.com")
     report = di.generate_identity_report(identity.identity_id)